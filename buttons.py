@@ -1,9 +1,30 @@
-import gc
+import array
 import displayio
-import adafruit_ticks
+from adafruit_ticks import ticks_ms as _ticks_ms, ticks_add as _ticks_add, ticks_diff as _ticks_diff
 from micropython import const
 from buzzer import Buzzer
 
+_BUTTON_SIZE = const(80)  # Size of the button in pixels (80x80)
+
+# State bit-fields: each state is a combination of these flags
+_FLAG_PRESS = const(0x01)      # Press in progress (touched, pending debounce or release)
+_FLAG_INDICATOR = const(0x02)  # Latching indicator is on
+_FLAG_DEBOUNCED = const(0x04)  # Touch confirmed, waiting for release
+
+# Button states, inlined by const() in hot paths (exposed as Button.STATE_*)
+_STATE_NORMAL = const(0b000)
+_STATE_PRESSED = const(0b001)               # _FLAG_PRESS
+_STATE_DEBOUNCED = const(0b101)             # _FLAG_PRESS | _FLAG_DEBOUNCED
+_STATE_INDICATOR = const(0b010)             # _FLAG_INDICATOR
+_STATE_INDICATOR_PRESSED = const(0b011)     # _FLAG_INDICATOR | _FLAG_PRESS
+_STATE_INDICATOR_DEBOUNCED = const(0b111)   # _FLAG_INDICATOR | _FLAG_PRESS | _FLAG_DEBOUNCED
+
+# Tile grid indices, inlined by const() in icon writes (exposed as Button.ICON_*)
+_ICON_NORMAL = const(0)
+_ICON_PRESSED = const(1)
+_ICON_INDICATOR = const(2)
+_ICON_INDICATOR_PRESSED = const(3)
+
 
 class Button:
     """A memory-optimized touch-enabled button widget with multiple visual states and optional latching behavior.
@@ -15,8 +36,8 @@ class Button:
 
     Memory Optimizations:
     - Uses __slots__ to prevent __dict__ creation (~200+ bytes saved per instance)
-    - Calculates touch boundaries on-demand instead of storing them (~16 bytes saved)
-    - Uses if/elif chains instead of dispatch tables (~150+ bytes saved per call)
+    - Touch hit-testing for all buttons is done in one pass by scan_hits()
+    - Whole state machine runs inside is_pressed (one Python call per button per frame)
     - Direct icon updates eliminate method call overhead
     - Minimal instance variables with efficient state management
 
@@ -33,25 +54,26 @@ class Button:
     - NORMAL → PRESSED → DEBOUNCED → INDICATOR (first press, toggles on) → INDICATOR_PRESSED → INDICATOR_DEBOUNCED → NORMAL (second press, toggles off)
     """
 
-    # Button state constants for touch handling
-    STATE_NORMAL = const(0)                   # Button idle, no touch detected
-    STATE_PRESSED = const(1)                  # Touch detected, waiting for debounce confirmation
-    STATE_DEBOUNCED = const(15)               # Touch confirmed, waiting for release to register press
-    STATE_INDICATOR = const(2)                # Latching mode: button in "on" state with indicator active
-    STATE_INDICATOR_PRESSED = const(3)        # Latching mode: indicator active and being touched
-    STATE_INDICATOR_DEBOUNCED = const(35)     # Latching mode: touch confirmed while in indicator state
+    # Button state constants for touch handling (aliases of the module-level const() values)
+    # Bit-field encoding: bit 0 = press in progress, bit 1 = indicator on, bit 2 = debounced
+    STATE_NORMAL = _STATE_NORMAL                            # Button idle, no touch detected
+    STATE_PRESSED = _STATE_PRESSED                          # Touch detected, waiting for debounce confirmation
+    STATE_DEBOUNCED = _STATE_DEBOUNCED                      # Touch confirmed, waiting for release to register press
+    STATE_INDICATOR = _STATE_INDICATOR                      # Latching mode: button in "on" state with indicator active
+    STATE_INDICATOR_PRESSED = _STATE_INDICATOR_PRESSED      # Latching mode: indicator active and being touched
+    STATE_INDICATOR_DEBOUNCED = _STATE_INDICATOR_DEBOUNCED  # Latching mode: touch confirmed while in indicator state
 
-    # Tile grid indices for different visual states
-    ICON_NORMAL = const(0)                    # Normal state: unpressed, no indicator
-    ICON_PRESSED = const(1)                   # Pressed state: being touched (any mode)
-    ICON_INDICATOR = const(2)                 # Indicator state: unpressed with status indicator
-    ICON_INDICATOR_PRESSED = const(3)         # Indicator state: being touched with status indicator
+    # Tile grid indices for different visual states (aliases of the module-level const() values)
+    ICON_NORMAL = _ICON_NORMAL                              # Normal state: unpressed, no indicator
+    ICON_PRESSED = _ICON_PRESSED                            # Pressed state: being touched (any mode)
+    ICON_INDICATOR = _ICON_INDICATOR                        # Indicator state: unpressed with status indicator
+    ICON_INDICATOR_PRESSED = _ICON_INDICATOR_PRESSED        # Indicator state: being touched with status indicator
 
-    BUTTON_SIZE = const(80)  # Size of the button in pixels (80x80)
+    BUTTON_SIZE = _BUTTON_SIZE  # Size of the button in pixels (80x80)
 
     # Use __slots__ to reduce memory overhead per instance
     # Only allows these specific attributes, preventing __dict__ creation
-    __slots__ = ('_x', '_y', '_name', '_latching', '_buzzer', '_state', '_is_touched', '_last_touch_time', '_debounce_delay', 'icon')
+    __slots__ = ('_x', '_y', '_name', '_latching', '_buzzer', '_state', '_deadline', '_debounce_delay', 'icon')
 
     def __init__(self, x:int, y:int, group:displayio.Group, name:str, latching:bool=None, buzzer: Buzzer = None, debounce_delay:int=150):
         """Initialize a button widget at the specified screen coordinates.
@@ -75,7 +97,7 @@ class Button:
         - Tile 2: Unpressed with status indicator (latching mode)
         - Tile 3: Pressed with status indicator (latching mode)
         """
-        # Store position coordinates (boundaries calculated on-demand to save memory)
+        # Store position coordinates (boundaries calculated in scan_hits to save memory)
         self._x = x
         self._y = y
 
@@ -85,39 +107,21 @@ class Button:
         self._buzzer = buzzer
 
         # Touch state management
-        self._state = Button.STATE_NORMAL
-        self._is_touched = False  # Current touch state
-        self._last_touch_time = 0
+        self._state = _STATE_NORMAL
+        self._deadline = 0  # ticks_ms time at which the current touch passes debounce
         self._debounce_delay = debounce_delay
 
-        gc.collect()  # Free memory before graphics loading
-
         # Load button graphics as a tile grid for efficient state switching
         # Renamed from tile_grid to icon for clarity and memory optimization
-        bitmap = displayio.OnDiskBitmap(f"/image/{name}.bmp")
-        self.icon = displayio.TileGrid(bitmap, pixel_shader=bitmap.pixel_shader, tile_width=Button.BUTTON_SIZE, tile_height=Button.BUTTON_SIZE)
+        bitmap = displayio.OnDiskBitmap("/image/" + name + ".bmp")
+        self.icon = displayio.TileGrid(bitmap, pixel_shader=bitmap.pixel_shader, tile_width=_BUTTON_SIZE, tile_height=_BUTTON_SIZE)
         self.icon.x = x
         self.icon.y = y
         group.append(self.icon)
 
 
 
-    def _check_touch(self, touches: list[tuple]) -> bool:
-        """Check if any touch point intersects with this button's boundaries.
-
-        :param touches: List of touch points as (x, y, area) tuples
-        :return: True if button is being touched, False otherwise
-        """
-        # Calculate boundaries on-demand to save memory
-        x_max = self._x + Button.BUTTON_SIZE
-        y_max = self._y + Button.BUTTON_SIZE
-        
-        for x, y, a in touches:  # Unpack directly in loop
-            if (self._x <= x <= x_max and self._y <= y <= y_max):
-                return True
-        return False
-
-    def is_pressed(self, touches: list[tuple]) -> bool:
+    def is_pressed(self, is_touched: bool) -> bool:
         """Process touch input and return True if button press is confirmed.
 
         Implements a state machine for reliable touch detection with debouncing.
@@ -132,98 +136,91 @@ class Button:
 
         Visual feedback and optional buzzer feedback are provided when touch is confirmed.
 
-        :param touches: List of touch points as (x, y, area) tuples from touch controller
+        :param is_touched: True if any touch point is inside this button (see scan_hits)
         :return: True if button press is confirmed (touch released after debounce), False otherwise
         """
-        self._is_touched = self._check_touch(touches)
-        time_since_last_touch = adafruit_ticks.ticks_diff(adafruit_ticks.ticks_ms(), self._last_touch_time)
-
-        # Use optimized if/elif chain instead of dispatch table to save memory
-        # Avoids creating a dictionary with function references on every call
-        if self._state == Button.STATE_NORMAL:
-            return self._handle_normal_state()
-        elif self._state == Button.STATE_PRESSED:
-            return self._handle_pressed_state(time_since_last_touch)
-        elif self._state == Button.STATE_DEBOUNCED:
-            return self._handle_debounced_state()
-        elif self._state == Button.STATE_INDICATOR:
-            return self._handle_indicator_state()
-        elif self._state == Button.STATE_INDICATOR_PRESSED:
-            return self._handle_indicator_pressed_state(time_since_last_touch)
-        elif self._state == Button.STATE_INDICATOR_DEBOUNCED:
-            return self._handle_indicator_debounced_state()
-        return False
-
-    def _handle_normal_state(self) -> bool:
-        """Handle STATE_NORMAL: Button idle, waiting for initial touch."""
-        if self._is_touched:
-            self._last_touch_time = adafruit_ticks.ticks_ms()
-            self._state = Button.STATE_PRESSED
-        return False
-
-    def _handle_pressed_state(self, time_since_last_touch: int) -> bool:
-        """Handle STATE_PRESSED: Touch detected, verifying it's not a false trigger.
-        
-        :param time_since_last_touch: Time elapsed since touch started (milliseconds)
-        """
-        if self._is_touched:
-            if time_since_last_touch > self._debounce_delay:
-                # Touch confirmed after debounce period
-                self._state = Button.STATE_DEBOUNCED
-                self.icon[0] = Button.ICON_PRESSED  # Direct icon update for memory efficiency
-                if self._buzzer:
-                    self._buzzer.play_tone(1760, 2)  # Inline buzzer code to eliminate method call overhead
-        else:
-            # Touch released too early - return to normal
-            self._state = Button.STATE_NORMAL
-            self.icon[0] = Button.ICON_NORMAL
-        return False
-
-    def _handle_debounced_state(self) -> bool:
-        """Handle STATE_DEBOUNCED: Touch confirmed, waiting for release to complete press."""
-        if not self._is_touched:
+        global _active_count
+
+        state = self._state
+
+        # Fast path: idle (NORMAL or INDICATOR) and untouched - nothing can change
+        if not is_touched and not state & _FLAG_PRESS:
+            return False
+
+        # Bind hot attributes to locals once; self._state is written back only on transitions
+        icon = self.icon
+
+        # Whole state machine fused into one method to avoid a second call per frame
+        if state == _STATE_NORMAL:
+            # Button idle and touched (untouched case handled by the fast path)
+            self._deadline = _ticks_add(_ticks_ms(), self._debounce_delay)
+            self._state = _STATE_PRESSED
+            _active_count += 1
+            return False
+
+        if state == _STATE_PRESSED:
+            # Touch detected, verifying it's not a false trigger
+            if is_touched:
+                if _ticks_diff(_ticks_ms(), self._deadline) > 0:
+                    # Touch confirmed after debounce period
+                    self._state = _STATE_DEBOUNCED
+                    icon[0] = _ICON_PRESSED
+                    if self._buzzer:
+                        self._buzzer.play_tone(1760, 2)
+            else:
+                # Touch released too early - return to normal
+                self._state = _STATE_NORMAL
+                icon[0] = _ICON_NORMAL
+                _active_count -= 1
+            return False
+
+        if state == _STATE_DEBOUNCED:
+            # Touch confirmed, waiting for release to complete press
+            if is_touched:
+                return False
             # Touch released - button press confirmed!
             if self._latching:
-                self._state = Button.STATE_INDICATOR
-                self.icon[0] = Button.ICON_INDICATOR  # Direct icon update
+                self._state = _STATE_INDICATOR
+                icon[0] = _ICON_INDICATOR
             else:
-                self._state = Button.STATE_NORMAL
-                self.icon[0] = Button.ICON_NORMAL
+                self._state = _STATE_NORMAL
+                icon[0] = _ICON_NORMAL
+            _active_count -= 1
             return True
-        return False
-
-    def _handle_indicator_state(self) -> bool:
-        """Handle STATE_INDICATOR: Latching button in 'on' state, waiting for touch to turn off."""
-        if self._is_touched:
-            self._last_touch_time = adafruit_ticks.ticks_ms()
-            self._state = Button.STATE_INDICATOR_PRESSED
-        return False
 
-    def _handle_indicator_pressed_state(self, time_since_last_touch: int) -> bool:
-        """Handle STATE_INDICATOR_PRESSED: Indicator active, touch detected, verifying debounce.
-        
-        :param time_since_last_touch: Time elapsed since touch started (milliseconds)
-        """
-        if self._is_touched:
-            if time_since_last_touch > self._debounce_delay:
-                # Touch confirmed after debounce period
-                self._state = Button.STATE_INDICATOR_DEBOUNCED
-                self.icon[0] = Button.ICON_INDICATOR_PRESSED  # Direct icon update
-                if self._buzzer:
-                    self._buzzer.play_tone(1760, 2)  # Inline buzzer code
-        else:
-            # Touch released too early - return to indicator state
-            self._state = Button.STATE_INDICATOR
-            self.icon[0] = Button.ICON_INDICATOR
-        return False
-
-    def _handle_indicator_debounced_state(self) -> bool:
-        """Handle STATE_INDICATOR_DEBOUNCED: Indicator touch confirmed, waiting for release to turn off."""
-        if not self._is_touched:
+        if state == _STATE_INDICATOR:
+            # Latching button in 'on' state and touched (untouched case handled by the fast path)
+            self._deadline = _ticks_add(_ticks_ms(), self._debounce_delay)
+            self._state = _STATE_INDICATOR_PRESSED
+            _active_count += 1
+            return False
+
+        if state == _STATE_INDICATOR_PRESSED:
+            # Indicator active, touch detected, verifying debounce
+            if is_touched:
+                if _ticks_diff(_ticks_ms(), self._deadline) > 0:
+                    # Touch confirmed after debounce period
+                    self._state = _STATE_INDICATOR_DEBOUNCED
+                    icon[0] = _ICON_INDICATOR_PRESSED
+                    if self._buzzer:
+                        self._buzzer.play_tone(1760, 2)
+            else:
+                # Touch released too early - return to indicator state
+                self._state = _STATE_INDICATOR
+                icon[0] = _ICON_INDICATOR
+                _active_count -= 1
+            return False
+
+        if state == _STATE_INDICATOR_DEBOUNCED:
+            # Indicator touch confirmed, waiting for release to turn off
+            if is_touched:
+                return False
             # Touch released - button press confirmed, turn off latching button
-            self._state = Button.STATE_NORMAL
-            self.icon[0] = Button.ICON_NORMAL  # Direct icon update
+            self._state = _STATE_NORMAL
+            icon[0] = _ICON_NORMAL
+            _active_count -= 1
             return True
+
         return False
 
 
@@ -236,7 +233,7 @@ class Button:
 
         :return: True if button is in indicator state (latching mode "on"), False otherwise
         """
-        return self._state in (Button.STATE_INDICATOR, Button.STATE_INDICATOR_PRESSED, Button.STATE_INDICATOR_DEBOUNCED)
+        return bool(self._state & _FLAG_INDICATOR)
 
     @indicator.setter
     def indicator(self, state: bool) -> None:
@@ -247,13 +244,17 @@ class Button:
 
         :param state: True to activate indicator (turn "on"), False to deactivate (turn "off")
         """
+        global _active_count
         if self._latching:
+            if self._state & _FLAG_PRESS:
+                # Abandon an in-progress press so the active count stays balanced
+                _active_count -= 1
             if state:
-                self._state = Button.STATE_INDICATOR
-                self.icon[0] = Button.ICON_INDICATOR  # Direct icon update for efficiency
+                self._state = _STATE_INDICATOR
+                self.icon[0] = _ICON_INDICATOR  # Direct icon update for efficiency
             else:
-                self._state = Button.STATE_NORMAL
-                self.icon[0] = Button.ICON_NORMAL
+                self._state = _STATE_NORMAL
+                self.icon[0] = _ICON_NORMAL
 
     @property
     def latching(self) -> bool:
@@ -271,3 +272,64 @@ class Button:
         """
         return self._name
 
+
+# Number of buttons part-way through a press (state has _FLAG_PRESS set)
+_active_count = 0
+
+
+def any_active() -> bool:
+    """Check whether any button is part-way through a press.
+
+    When this returns False and there are no touches, every button's
+    is_pressed() would return False without changing state, so the caller
+    can skip the whole button sweep for that frame.
+
+    :return: True if at least one button needs is_pressed() called this frame
+    """
+    return _active_count != 0
+
+
+# Cached button bounding-box edges for scan_hits (buttons do not move once created)
+_scan_buttons = None
+_scan_x0s = None
+_scan_y0s = None
+_scan_x1s = None
+_scan_y1s = None
+
+
+def scan_hits(buttons: list[Button], touch_xs: array.array, touch_ys: array.array, touch_count: int) -> int:
+    """Hit-test all touch points against all buttons in a single sweep.
+
+    Button bounding boxes are copied into parallel arrays of edges on the first
+    call (or when a different button list is passed), so no box edges are
+    recomputed per test. Touch points arrive as parallel x/y arrays, so each
+    test is plain integer subscripts with no tuple unpacking. The result is
+    returned as a bitmask so no list is allocated per frame.
+
+    :param buttons: List of Button instances to test
+    :param touch_xs: Touch point X coordinates
+    :param touch_ys: Touch point Y coordinates
+    :param touch_count: Number of valid entries in touch_xs/touch_ys
+    :return: Bitmask with bit i set when buttons[i] is touched
+    """
+    global _scan_buttons, _scan_x0s, _scan_y0s, _scan_x1s, _scan_y1s
+    if buttons is not _scan_buttons:
+        _scan_buttons = buttons
+        _scan_x0s = array.array('H', [button._x for button in buttons])
+        _scan_y0s = array.array('H', [button._y for button in buttons])
+        _scan_x1s = array.array('H', [button._x + _BUTTON_SIZE for button in buttons])
+        _scan_y1s = array.array('H', [button._y + _BUTTON_SIZE for button in buttons])
+
+    x0s = _scan_x0s
+    y0s = _scan_y0s
+    x1s = _scan_x1s
+    y1s = _scan_y1s
+    count = len(x0s)
+    hits = 0
+    for t in range(touch_count):
+        tx = touch_xs[t]
+        ty = touch_ys[t]
+        for i in range(count):
+            if x0s[i] <= tx <= x1s[i] and y0s[i] <= ty <= y1s[i]:
+                hits |= 1 << i
+    return hits
@@ -1,5 +1,6 @@
 # Hardware and System Imports
 import gc
+import array
 import time
 import board
 import digitalio
@@ -14,12 +15,17 @@ import gt911
 import busio
 
 # Local Module Imports
-from buttons import Button
+from buttons import Button, any_active, scan_hits
 from buzzer import Buzzer
 
 SCREEN_RESOLUTION_X = 320
 SCREEN_RESOLUTION_Y = 240
 
+GC_LOW_WATER = 8192  # Only collect garbage when free heap drops below this (bytes)
+DEBUG = True         # Print button press events to the serial console
+MAX_TOUCHES = 5      # GT911 reports at most 5 simultaneous touch points
+GRID_COLUMNS = 2     # Buttons per row in the button grid
+
 # Audio Setup
 buzzer = Buzzer(board.GP19)
 
@@ -65,24 +71,50 @@ button_config = [
 # Create button objects from configuration (3x2 grid: 3 rows, 2 columns)
 buttons = []
 for i, config in enumerate(button_config):
-    row = i // 2  # Integer division for row (every 2 buttons = new row)
-    col = i % 2   # Modulo for column (0, 1 within each row)
-    x = col * 80
-    y = row * 80
+    row = i // GRID_COLUMNS  # Integer division for row (every GRID_COLUMNS buttons = new row)
+    col = i % GRID_COLUMNS   # Modulo for column (0, 1 within each row)
+    x = col * Button.BUTTON_SIZE
+    y = row * Button.BUTTON_SIZE
     button = Button(x, y, group, config["name"], config["latching"], buzzer=buzzer)
     buttons.append(button)
+gc.collect()  # Free construction garbage once all button graphics are loaded
+
+# Buttons pressed this frame, reported after the touch sweep
+events = []
+
+# Touch coordinates for the current frame, reused every frame (first touch_count entries valid)
+touch_xs = array.array('H', [0] * MAX_TOUCHES)
+touch_ys = array.array('H', [0] * MAX_TOUCHES)
 
 # MAIN LOOP
 while True:
-    gc.collect()  # Run garbage collection to free up memory
-
-    # Get current touch points from the touch controller
-    touches = gt.touches
-    for button in buttons:
-        if button.is_pressed(touches):
-            if button.latching:
-                print(f"Button {button.name} pressed - {'on' if button.indicator else 'off'}")
-            else:
-                print(f"Button {button.name} pressed")
+    # Collect only when the heap runs low; a full collect stalls the loop for several ms
+    if gc.mem_free() < GC_LOW_WATER:
+        gc.collect()
+
+    # Get current touch points from the touch controller, unpacked once into x/y arrays
+    touch_count = 0
+    for x, y, _ in gt.touches:
+        touch_xs[touch_count] = x
+        touch_ys[touch_count] = y
+        touch_count += 1
+
+    # Skip the button sweep on idle frames (no touches and no press in progress)
+    if touch_count or any_active():
+        hits = scan_hits(buttons, touch_xs, touch_ys, touch_count)  # Hit-test every button in one pass
+        for button in buttons:
+            if button.is_pressed(bool(hits & 1)):  # Lowest bit belongs to the current button
+                events.append(button)
+            hits >>= 1
+
+    # Report presses outside the touch sweep so serial output cannot delay it
+    if events:
+        if DEBUG:
+            for button in events:
+                if button.latching:
+                    print(f"Button {button.name} pressed - {'on' if button.indicator else 'off'}")
+                else:
+                    print(f"Button {button.name} pressed")
+        events.clear()
 
     time.sleep(0.05)  # 20Hz update rate for responsive touch detection
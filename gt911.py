@@ -1,3 +1,4 @@
+import binascii
 import struct
 import time
 import microcontroller
@@ -24,6 +25,7 @@ _REG_X_OUTPUT_MAX_LOW = const(0x8048)  # X resolution low byte in config
 _REG_X_OUTPUT_MAX_HIGH = const(0x8049) # X resolution high byte in config
 _REG_Y_OUTPUT_MAX_LOW = const(0x804A)  # Y resolution low byte in config
 _REG_Y_OUTPUT_MAX_HIGH = const(0x804B) # Y resolution high byte in config
+_REG_MODULE_SWITCH1 = const(0x804D)    # Module switch 1 (bits 0-1: INT trigger mode)
 _REG_CONFIG_CHKSUM = const(0x80FF)     # Configuration checksum byte
 _REG_CONFIG_FRESH = const(0x8100)      # Configuration update flag register
 
@@ -34,6 +36,42 @@ _REG_POINT_START = const(0x814F)       # First touch point coordinate data
 # Configuration constants
 _REG_CONFIG_SIZE = const(_REG_CONFIG_FRESH - _REG_CONFIG_START)  # Configuration block size (185 bytes)
 
+# Resolution fields within the configuration block: little-endian X then Y, starting at X low byte
+_X_LOW_OFF = const(_REG_X_OUTPUT_MAX_LOW - _REG_CONFIG_START)
+_CHKSUM_OFF = const(_REG_CONFIG_CHKSUM - _REG_CONFIG_START)  # Checksum byte within the configuration block
+_RESOLUTION_FORMAT = "<HH"
+
+# Touch point layout: little-endian x, y, size at byte offset 1 of each 8-byte block
+_TOUCH_FORMAT = "<HHH"
+_MAX_TOUCH_POINTS = const(5)                         # GT911 tracks up to 5 simultaneous touches
+_POLL_SIZE = const(1 + _MAX_TOUCH_POINTS * 8)        # Status byte + 5 touch blocks (41 bytes)
+
+# I2C packet layouts: big-endian 16-bit register address, optionally followed by one data byte
+_ADDR_FORMAT = ">H"
+_WRITE8_FORMAT = ">HB"
+
+# Precomputed register address packets for the hot polling path
+_ADDR_POINT_STATUS = struct.pack(_ADDR_FORMAT, _REG_POINT_STATUS)
+_CLEAR_POINT_STATUS = struct.pack(_WRITE8_FORMAT, _REG_POINT_STATUS, 0x00)  # Write 0 to status
+
+# Product info block layout: 4-char name, version, X resolution, Y resolution, vendor ID
+_PRODUCT_ID_FORMAT = "<4sHHHB"
+
+
+def _delay_us(delay_us: int) -> None:
+    """Busy-wait for at least the given number of microseconds.
+
+    time.sleep() only has millisecond resolution on CircuitPython and may
+    oversleep; polling time.monotonic_ns() keeps reset timing close to the
+    datasheet minimums.
+
+    :param delay_us: Delay in microseconds
+    :type delay_us: int
+    """
+    deadline = time.monotonic_ns() + delay_us * 1000
+    while time.monotonic_ns() < deadline:
+        pass
+
 
 class GT911:
     """Driver for Goodix GT911 capacitive touch controller.
@@ -108,8 +146,23 @@ class GT911:
         # Initialize I2C communication with the GT911 device
         self.i2c_device = I2CDevice(i2c, address)
 
+        # Reusable buffers: register address for reads, single-byte writes, and touch polling
+        self._addr_buf = bytearray(2)
+        self._write8_buf = bytearray(3)
+        self._poll_buf = bytearray(_POLL_SIZE)
+
+        # Product info block also reports the configured resolution, so _check_config reuses it
+        self._product_info = self._read_product_info()
         self._check_config(use_secondary_i2c_address)
 
+        # The INT line can gate polling only when configured as a level (not an edge pulse)
+        # Trigger mode: 0 = rising edge, 1 = falling edge, 2 = low level, 3 = high level
+        self._int_ready_level = None
+        if self._interrupt is not None:
+            trigger = self._read(_REG_MODULE_SWITCH1, 1)[0] & 0x03
+            if trigger & 0x02:
+                self._int_ready_level = bool(trigger & 0x01)  # Pin level meaning "data ready"
+
         # print(f"GT911 initialized with I2C address: {hex(address)}")
 
         # Set device to coordinate reading mode
@@ -121,7 +174,8 @@ class GT911:
         """Get GT911 device identification information.
 
         Reads the product identification register block to extract device metadata.
-        This information is useful for device verification and debugging.
+        This information is useful for device verification and debugging. The block
+        is constant for a given configuration, so it is read once and cached.
 
         Register layout (11 bytes starting at 0x8140):
         - Bytes 0-3: 4-character ASCII product identifier
@@ -133,17 +187,13 @@ class GT911:
         :return: Formatted string with device identification details
         :rtype: str
         """
-        # Read 11-byte product information block
-        data = self._read(_REG_PRODUCT_ID, 11)
+        # Parsed 11-byte product information block (cached)
+        name, version, x_resolution, y_resolution, vendor_id = self._cached_product_info()
         config_data = self._read(_REG_CONFIG_START, 1)
 
-        # Parse device information from register data
-        product_name = ''.join([chr(byte) for byte in data[:4]])  # ASCII product name
-        version = (data[5] << 8) | data[4]                        # Little-endian version
-        x_resolution = (data[7] << 8) | data[6]                   # Device-configured X resolution
-        y_resolution = (data[9] << 8) | data[8]                   # Device-configured Y resolution
-        vendor_id = data[10]                                      # Vendor identification
-        config_version_ascii = chr(config_data[0]) if 32 <= config_data[0] <= 126 else f"\\x{config_data[0]:02x}"
+        product_name = name.decode("ascii", "replace")            # ASCII product name
+        config_version = config_data[0]
+        config_version_ascii = chr(config_version) if 32 <= config_version <= 126 else f"\\x{config_version:02x}"
 
         return f"Product ID: {product_name} Version: {version:04x} Vendor: {vendor_id:02x} Size: {x_resolution}x{y_resolution} Config: {config_version_ascii}"
 
@@ -152,16 +202,14 @@ class GT911:
     def configured_resolution(self) -> tuple[int, int]:
         """Get GT911 device configured resolution.
 
-        Reads the device configuration registers to extract the configured
-        resolution of the touch panel.
+        Taken from the product information block, which is read once and
+        cached (and re-read after a configuration update).
 
         :return: Tuple containing the X and Y resolution
         :rtype: tuple[int, int]
         """
-        data = self._read(_REG_PRODUCT_ID, 10)
-        x_resolution = (data[7] << 8) | data[6]  # Device-configured X resolution
-        y_resolution = (data[9] << 8) | data[8]  # Device-configured Y resolution
-        return x_resolution, y_resolution
+        info = self._cached_product_info()
+        return info[2], info[3]  # Device-configured X and Y resolution
 
 
     @property
@@ -172,10 +220,11 @@ class GT911:
         currently active touch points. The GT911 supports up to 5 simultaneous touches.
 
         Touch data processing:
-        1. Check touch status register (0x814E) for data ready flag and touch count
-        2. For each active touch, read 8-byte coordinate block starting at 0x814F
+        1. Read status register (0x814E) and all 5 coordinate blocks (0x814F-0x8176)
+           in a single 41-byte transaction into a preallocated buffer
+        2. Check the status byte for data ready flag and touch count
         3. Extract X, Y coordinates and touch size from the coordinate data
-        4. Clear status register to acknowledge data read and prepare for next cycle
+        4. If data was ready, clear status register to acknowledge read and prepare for next cycle
 
         Touch coordinate format (per 8-byte block):
         - Byte 0: Touch ID and status flags
@@ -184,35 +233,104 @@ class GT911:
         - Bytes 5-6: Touch size/pressure (little-endian)
         - Byte 7: Reserved
 
+        If the INT pin is wired and the device is configured for level-triggered
+        interrupts, the I2C transaction is skipped while INT reports no data ready.
+
         :return: List of active touch points as (x, y, size) tuples.
                  Empty list if no touches detected or data not ready.
         :rtype: list[tuple[int, int, int]]
         """
-        # Initialize touch data storage for up to 5 simultaneous touches
-        touch_data = [tuple()] * 5
+        num_touch_points = self._poll()
+        if not num_touch_points:
+            return []  # Idle poll: skip the comprehension and range setup
+
+        # Extract X, Y, and size from bytes 1-6 of each block (skip touch ID in byte 0)
+        # Block i starts at offset 1 + i * 8 (after the status byte); unpack in place
+        poll_buf = self._poll_buf
+        return [struct.unpack_from(_TOUCH_FORMAT, poll_buf, i * 8 + 2) for i in range(num_touch_points)]
+
+
+    def touches_into(self, out: list[list[int]], max_points: int = _MAX_TOUCH_POINTS) -> int:
+        """Read current touch points into caller-owned storage without allocating.
+
+        Allocation-free alternative to the touches property for polling loops.
+        Each entry of out must be a mutable 3-element sequence (e.g. a list) that
+        receives [x, y, size]; entries beyond the returned count are left unchanged.
+
+        :param out: Preallocated list of 3-element lists to fill, one per touch point
+        :type out: list[list[int]]
+        :param max_points: Maximum number of touch points to store (default: 5)
+        :type max_points: int
+        :return: Number of entries of out filled with active touch points
+        :rtype: int
+        """
+        poll_buf = self._poll_buf
+        num_touch_points = min(self._poll(), max_points, len(out))
+
+        for i in range(num_touch_points):
+            # Decode little-endian x, y, size directly from the poll buffer (no tuple allocation)
+            offset = i * 8 + 2
+            point = out[i]
+            point[0] = poll_buf[offset] | (poll_buf[offset + 1] << 8)
+            point[1] = poll_buf[offset + 2] | (poll_buf[offset + 3] << 8)
+            point[2] = poll_buf[offset + 4] | (poll_buf[offset + 5] << 8)
+
+        return num_touch_points
+
+
+    def _poll(self) -> int:
+        """Read touch status and all touch blocks into the poll buffer.
+
+        Shared by touches and touches_into. After this returns, self._poll_buf
+        holds the status byte followed by the 8-byte touch blocks.
+
+        :return: Number of valid touch blocks in the poll buffer (0 if no data ready)
+        :rtype: int
+        """
+        # Reading a GPIO is far cheaper than an I2C transaction - skip it when idle
+        if self._int_ready_level is not None and self._interrupt.value != self._int_ready_level:
+            return 0
+
         num_touch_points = 0
+        poll_buf = self._poll_buf
 
-        # Read touch status register to check for ready data
-        touch_status = self._read(_REG_POINT_STATUS, 1)[0]
+        # Hold the bus once for both the read and the acknowledge
+        with self.i2c_device as i2c:
+            # Read status byte and every touch block in one transaction (register address auto-increments)
+            i2c.write_then_readinto(_ADDR_POINT_STATUS, poll_buf)
+            touch_status = poll_buf[0]
 
-        # Process touch data if ready flag (bit 7) is set
-        if touch_status & 0x80:  # Touch data ready flag
-            num_touch_points = touch_status & 0x0F  # Extract touch count (bits 0-3)
+            # Process touch data if ready flag (bit 7) is set
+            if touch_status & 0x80:  # Touch data ready flag
+                num_touch_points = min(touch_status & 0x0F, _MAX_TOUCH_POINTS)  # Extract touch count (bits 0-3)
 
-            # Read coordinate data for each active touch point
-            for i in range(num_touch_points):
-                # Each touch point uses 8 bytes of coordinate data
-                coordinate_data = self._read(_REG_POINT_START + i * 8, 8)
+                # Clear touch status register to acknowledge read and prepare for next cycle
+                # (only needed when data was delivered - the flag is already clear otherwise)
+                i2c.write(_CLEAR_POINT_STATUS)
 
-                # Extract X, Y, and size from bytes 1-6 (skip touch ID in byte 0)
-                # Format: little-endian 16-bit values for x, y, size
-                touch_data[i] = struct.unpack("<HHH", coordinate_data[1:7])
+        return num_touch_points
 
-        # Clear touch status register to acknowledge read and prepare for next cycle
-        self._write_8(_REG_POINT_STATUS, 0x00)
 
-        # Return only the active touch points (slice to actual count)
-        return touch_data[:num_touch_points]
+    def _cached_product_info(self) -> tuple:
+        """Return the parsed product information block, reading it only if not cached.
+
+        :return: (name, version, x_resolution, y_resolution, vendor_id)
+        :rtype: tuple[bytes, int, int, int, int]
+        """
+        info = self._product_info
+        if info is None:
+            info = self._product_info = self._read_product_info()
+        return info
+
+
+    def _read_product_info(self) -> tuple:
+        """Read and parse the 11-byte product information block at 0x8140.
+
+        :return: (name, version, x_resolution, y_resolution, vendor_id) where name is
+                 the raw 4-byte product identifier
+        :rtype: tuple[bytes, int, int, int, int]
+        """
+        return struct.unpack_from(_PRODUCT_ID_FORMAT, self._read(_REG_PRODUCT_ID, 11))
 
 
     def _check_config(self, use_secondary_i2c_address: bool) -> None:
@@ -223,14 +341,13 @@ class GT911:
         the target resolution and recalculates the configuration checksum.
 
         Configuration process:
-        1. Read 185-byte configuration block from device
-        2. Extract current X/Y resolution from config bytes
-        3. Compare with target resolution (self._width, self._height)
-        4. If different, update resolution bytes in config buffer
+        1. Take the current resolution from the product info read by __init__
+        2. Compare with target resolution (self._width, self._height)
+        3. If different, read the 185-byte configuration block from device
+        4. Update resolution bytes in config buffer
         5. Recalculate and update configuration checksum
-        6. Write updated configuration back to device
-        7. Re-read configuration to verify write operation
-        8. Signal device to reload configuration
+        6. Write updated configuration back to device, followed by the fresh flag
+           in the same transaction to signal the device to reload it
 
         Register layout for resolution:
         - 0x8048: X resolution low byte
@@ -243,42 +360,36 @@ class GT911:
         :param use_secondary_i2c_address: I2C address configuration flag (for future extensibility)
         :type use_secondary_i2c_address: bool
         """
-        # Read complete configuration block from device (185 bytes)
-        config_buffer = self._read(_REG_CONFIG_START, _REG_CONFIG_SIZE)
-        time.sleep(.5)  # Allow device time to stabilize after config read
-
-        # Extract currently configured resolution from config buffer
-        x_low_offset = _REG_X_OUTPUT_MAX_LOW - _REG_CONFIG_START
-        x_high_offset = _REG_X_OUTPUT_MAX_HIGH - _REG_CONFIG_START
-        y_low_offset = _REG_Y_OUTPUT_MAX_LOW - _REG_CONFIG_START
-        y_high_offset = _REG_Y_OUTPUT_MAX_HIGH - _REG_CONFIG_START
-
-        current_width = (config_buffer[x_high_offset] << 8) | config_buffer[x_low_offset]
-        current_height = (config_buffer[y_high_offset] << 8) | config_buffer[y_low_offset]
+        # Currently configured resolution, already read with the product info block
+        _, _, current_width, current_height, _ = self._product_info
 
         # Update configuration if resolution doesn't match target values
         if current_width != self._width or current_height != self._height:
             print(f"Updating GT911 resolution to {self._width} x {self._height}")
 
+            # Read complete configuration block from device (185 bytes) after a 2-byte
+            # register address prefix, so the same buffer can be written back unchanged.
+            # One extra trailing byte lands on the fresh flag register (0x8100), which
+            # directly follows the checksum, so the write also signals a reload.
+            write_buffer = bytearray(2 + _REG_CONFIG_SIZE + 1)
+            config_buffer = memoryview(write_buffer)[2:2 + _REG_CONFIG_SIZE]
+            write_buffer[-1] = 0x01  # Configuration fresh flag
+            self._read_into(_REG_CONFIG_START, config_buffer)
+
             # Update resolution values in configuration buffer (little-endian format)
-            config_buffer[x_low_offset] = self._width & 0xFF           # X low byte
-            config_buffer[x_high_offset] = (self._width >> 8) & 0xFF   # X high byte
-            config_buffer[y_low_offset] = self._height & 0xFF          # Y low byte
-            config_buffer[y_high_offset] = (self._height >> 8) & 0xFF  # Y high byte
+            struct.pack_into(_RESOLUTION_FORMAT, config_buffer, _X_LOW_OFF, self._width, self._height)
 
             # Recalculate configuration checksum using dedicated helper method
             checksum = self._checksum(config_buffer)
-            config_buffer[_REG_CONFIG_CHKSUM - _REG_CONFIG_START] = checksum
+            config_buffer[_CHKSUM_OFF] = checksum
 
-            # Write updated configuration to device
-            self._write_bytes(_REG_CONFIG_START, config_buffer)
-            
-            # Re-read configuration to verify the write operation was successful
-            config_buffer = self._read(_REG_CONFIG_START, _REG_CONFIG_SIZE)
-            time.sleep(1)  # Allow device time to process configuration update
+            # Write updated configuration and fresh flag to device in one transaction,
+            # without copying the config block (register address auto-increments)
+            self._write_prefixed(_REG_CONFIG_START, write_buffer)
+            time.sleep(.01)  # Allow device firmware to reload the new configuration
 
-            # Signal device to reload configuration from internal memory
-            self._write_8(_REG_CONFIG_FRESH, 0x01)
+            # Drop the cached product info so the applied resolution is read back from the device
+            self._product_info = None
 
 
     def _checksum(self, config_buffer: bytearray) -> int:
@@ -286,21 +397,17 @@ class GT911:
               
         Checksum calculation:
         1. Sum all bytes in the configuration buffer except the last byte (checksum)
-        2. Apply two's complement: checksum = (~sum + 1) & 0xFF
+        2. Apply two's complement: checksum = (~sum + 1) & 0xFF, i.e. (-sum) & 0xFF
         3. This ensures that sum of all config bytes + checksum = 0 (mod 256)
         
         :param config_buffer: Configuration data buffer (185 bytes)
-        :type config_buffer: bytearray
+        :type config_buffer: bytearray or memoryview
         :return: Calculated checksum byte (0-255)
         :rtype: int
         """
-        checksum = 0
-        # Sum all configuration bytes except the checksum byte (last byte)
-        for i in range(_REG_CONFIG_SIZE - 1):
-            checksum += config_buffer[i] & 0xFF  # Ensure byte-wise addition
-        # Two's complement checksum calculation
-        checksum = (~checksum + 1) & 0xFF
-        return checksum
+        # Sum all configuration bytes except the checksum byte (last byte), in C via sum() over
+        # a memoryview, and negate modulo 256 for the two's complement checksum
+        return (-sum(memoryview(config_buffer)[:_REG_CONFIG_SIZE - 1])) & 0xFF
 
 
     def print_buffer(self, address: int, buffer: bytearray) -> None:
@@ -329,13 +436,12 @@ class GT911:
             line_addr = address + i
             # Extract 16-byte chunk (or remaining bytes if less than 16)
             chunk = buffer[i:i+16]
-            # Format hex bytes with spaces
-            hex_bytes = ' '.join(f'{byte:02X}' for byte in chunk)
-            # Pad hex string to consistent width (47 chars for 16 bytes)
-            hex_string = f"{hex_bytes:<47}"
+            # Format hex bytes with spaces (hexlify does the per-byte work in C)
+            hex_bytes = binascii.hexlify(chunk, ' ').decode().upper()
             # Convert bytes to ASCII characters (printable chars only, others as '.')
             ascii_chars = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
-            print(f"0x{line_addr:04X}: {hex_string} |{ascii_chars}|")
+            # Hex string padded to consistent width (47 chars for 16 bytes) in one %-format call
+            print("0x%04X: %-47s |%s|" % (line_addr, hex_bytes, ascii_chars))
 
 
     def _perform_reset(self, use_secondary_i2c_address: bool) -> None:
@@ -347,7 +453,8 @@ class GT911:
 
         Reset sequence (when reset pin available):
         1. Set reset pin to output mode, initially high
-        2. If interrupt pin available, pulse reset briefly to prepare INT configuration
+        2. If interrupt pin available and the secondary address is requested,
+           pulse reset briefly to prepare INT configuration
         3. Assert reset (low) for >10ms to halt device operation
         4. Configure interrupt pin state to set desired I2C address:
            - Low (False): Device will use address 0x5D (GT911_DEFAULT_I2C_ADDR)
@@ -367,34 +474,39 @@ class GT911:
                 self._interrupt.switch_to_input()  # Set up for interrupt monitoring
             return
 
+        # Bind pins to locals once for the rest of the sequence
+        reset = self._reset
+        interrupt = self._interrupt
+
         # Initialize reset pin for output control
-        self._reset.switch_to_output(True)  # Start with reset deasserted (high)
+        reset.switch_to_output(True)  # Start with reset deasserted (high)
 
-        if self._interrupt:
+        if interrupt and use_secondary_i2c_address:
             # Brief reset pulse to prepare for interrupt pin configuration
             # This ensures the device is in a known state before the main reset
-            self._reset.value = False
-            time.sleep(0.005)  # Wait >5ms for device to recognize reset
-            self._reset.value = True
+            # (not needed for the default address, which the main sequence selects on its own)
+            reset.value = False
+            _delay_us(5050)  # Wait >5ms for device to recognize reset
+            reset.value = True
 
         # Main reset sequence: halt device operation
-        self._reset.value = False  # Assert reset (device stopped)
-        time.sleep(0.01)  # Wait >10ms as required by GT911 specification
+        reset.value = False  # Assert reset (device stopped)
+        _delay_us(10050)  # Wait >10ms as required by GT911 specification
 
         # Configure I2C address via interrupt pin state during reset release
-        if self._interrupt:
+        if interrupt:
             # Set interrupt pin to desired state using open-drain mode
             # Pin state determines I2C address: High=0x14, Low=0x5D
-            self._interrupt.switch_to_output(use_secondary_i2c_address,
-                                           drive_mode=DriveMode.OPEN_DRAIN)
-            time.sleep(0.0001)  # Wait >10μs for pin state to stabilize
+            interrupt.switch_to_output(use_secondary_i2c_address,
+                                       drive_mode=DriveMode.OPEN_DRAIN)
+            _delay_us(100)  # Wait >10μs for pin state to stabilize
 
         # Release reset and complete initialization
-        self._reset.value = True  # Release reset (start device)
+        reset.value = True  # Release reset (start device)
 
-        if self._interrupt:
-            time.sleep(0.005)  # Wait >5ms for device startup completion
-            self._interrupt.switch_to_input()  # Switch to interrupt monitoring mode
+        if interrupt:
+            _delay_us(5050)  # Wait >5ms for device startup completion
+            interrupt.switch_to_input()  # Switch to interrupt monitoring mode
 
 
     def _read(self, register: int, length: int) -> bytearray:
@@ -412,15 +524,29 @@ class GT911:
         :return: Raw data bytes read from the device registers
         :rtype: bytearray
         """
-        # Prepare 16-bit register address in big-endian format for GT911
-        register_bytes = bytes([register >> 8, register & 0xFF])
         result_buffer = bytearray(length)
+        self._read_into(register, result_buffer)
+        return result_buffer
+
+
+    def _read_into(self, register: int, buffer: bytearray) -> None:
+        """Read GT911 register(s) into a caller-supplied buffer.
+
+        Same transaction as _read(), but fills an existing buffer so callers that
+        already own one (or a memoryview slice of one) avoid a new bytearray.
+
+        :param register: 16-bit register address to read from (0x8000-0x81FF range)
+        :type register: int
+        :param buffer: Buffer to fill; its length sets the number of bytes read
+        :type buffer: bytearray
+        """
+        # Prepare 16-bit register address in big-endian format in the reusable address buffer
+        addr_buf = self._addr_buf
+        struct.pack_into(_ADDR_FORMAT, addr_buf, 0, register)
 
         # Execute I2C write-then-read transaction
         with self.i2c_device as i2c:
-            i2c.write_then_readinto(register_bytes, result_buffer)
-
-        return result_buffer
+            i2c.write_then_readinto(addr_buf, buffer)
 
 
     def _write_8(self, register: int, data: int) -> None:
@@ -437,40 +563,31 @@ class GT911:
         :param data: Single byte value to write (0-255, will be masked to 8 bits)
         :type data: int
         """
-        # Construct 3-byte I2C write packet: [addr_high, addr_low, data]
-        write_buffer = bytearray(3)
-        write_buffer[0] = (register >> 8) & 0xFF  # Register address high byte
-        write_buffer[1] = register & 0xFF         # Register address low byte
-        write_buffer[2] = data & 0xFF             # Data byte (masked to 8 bits)
+        # Fill the reusable 3-byte I2C write packet: [addr_high, addr_low, data]
+        write_buffer = self._write8_buf
+        struct.pack_into(_WRITE8_FORMAT, write_buffer, 0, register, data & 0xFF)  # Data masked to 8 bits
 
         # Execute I2C write transaction
         with self.i2c_device as i2c:
-            i2c.write(bytes(write_buffer))
-
+            i2c.write(write_buffer)
 
-    def _write_bytes(self, register: int, data: bytearray) -> None:
-        """Write multiple bytes to consecutive GT911 registers.
 
-        Writes a block of data to consecutive GT911 registers starting at the
-        specified address. This is commonly used for updating configuration data
-        or writing large data structures to the device.
+    def _write_prefixed(self, register: int, buffer: bytearray) -> None:
+        """Write a payload that already has 2 spare bytes reserved for the register address.
 
-        The GT911 auto-increments the internal register pointer, so consecutive
-        bytes are written to sequential register addresses.
+        The first two bytes of buffer are overwritten with the big-endian register
+        address and the whole buffer is sent as one transaction. Callers that build
+        their payload at offset 2 of a single buffer avoid any copy of the data.
 
-        Transaction format: [addr_high, addr_low, data_byte_0, data_byte_1, ...]
+        Transaction format: [addr_high, addr_low, buffer[2], buffer[3], ...]
 
         :param register: 16-bit starting register address (0x8000-0x81FF range)
         :type register: int
-        :param data: Array of bytes to write sequentially to consecutive registers
-        :type data: bytearray
+        :param buffer: Write packet; bytes 0-1 are reserved for the address, payload follows
+        :type buffer: bytearray
         """
-        # Construct I2C write packet: [addr_high, addr_low, data_bytes...]
-        write_buffer = bytearray(2 + len(data))
-        write_buffer[0] = (register >> 8) & 0xFF  # Register address high byte
-        write_buffer[1] = register & 0xFF         # Register address low byte
-        write_buffer[2:] = data                   # Sequential data bytes
+        struct.pack_into(_ADDR_FORMAT, buffer, 0, register)  # Register address high/low bytes
 
         # Execute I2C write transaction
         with self.i2c_device as i2c:
-            i2c.write(bytes(write_buffer))
\ No newline at end of file
+            i2c.write(buffer)
\ No newline at end of file